@@ -13,10 +13,10 @@ YouTube Channel Finder v4.6.0
 import os
 import sys
 import re
+import shutil
 import urllib.parse
 import json
 import subprocess
-import urllib.request
 import platform
 
 # ── Cross-platform single-keypress read ──────────────────────────────────────
@@ -42,6 +42,7 @@ else:
             termios.tcsetattr(fd, termios.TCSADRAIN, old)
 import time
 import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 
 try:
@@ -53,15 +54,73 @@ except ImportError:
     input("Press Enter to exit...")
     sys.exit(1)
 
+try:
+    import requests
+except ImportError:
+    print("requests is not installed.")
+    print("Run:  pip install requests")
+    input("Press Enter to exit...")
+    sys.exit(1)
+
+try:
+    import diskcache
+except ImportError:
+    diskcache = None  # optional — without it every lookup goes to the API
+
+try:
+    # Optional: decode API responses with orjson. googleapiclient runs
+    # json.loads on every payload — 50-200 KB per videos.list chunk on the
+    # classification path — and orjson decodes those several times faster.
+    import orjson
+    import googleapiclient.http as _gapi_http
+    import googleapiclient.model as _gapi_model
+
+    class _OrjsonShim:
+        """json-module stand-in: C-level loads, stdlib dumps (str output —
+        orjson.dumps returns bytes, which googleapiclient does not expect).
+
+        orjson raises json.JSONDecodeError subclasses, so the stdlib
+        decoder/exception attributes keep googleapiclient's except
+        clauses (e.g. JsonModel.deserialize) working.
+        """
+        loads = staticmethod(orjson.loads)
+        dumps = staticmethod(json.dumps)
+        decoder = json.decoder
+        JSONDecodeError = json.JSONDecodeError
+
+    _gapi_http.json = _OrjsonShim
+    _gapi_model.json = _OrjsonShim
+except ImportError:
+    pass  # stdlib json remains in place
+
 # ── Paths ────────────────────────────────────────────────────────────────
 SCRIPT_DIR    = os.path.dirname(os.path.abspath(__file__))
 API_KEYS_FILE = os.path.join(SCRIPT_DIR, 'api_keys.txt')
 OUTPUT_FILE   = os.path.join(SCRIPT_DIR, 'find.txt')
+OUTPUT_INDEX  = os.path.join(SCRIPT_DIR, 'find.idx')
 THUMBS_DIR    = os.path.join(SCRIPT_DIR, 'thumbnails')
 DOWNLOADS_DIR = os.path.join(SCRIPT_DIR, 'downloads')
 PARSED_DIR    = os.path.join(SCRIPT_DIR, 'parsed')
 VIDEOLINKS    = os.path.join(SCRIPT_DIR, 'videolinks.txt')
 
+# ── Disk-backed API response cache (SQLite via diskcache) ────────────────
+# Channel stats, handle resolutions and video durations rarely change, so
+# repeat searches against the same IDs are served locally instead of
+# re-burning API quota. Entries expire after 24 hours.
+_CACHE_TTL = 86400
+_CACHE = diskcache.Cache(os.path.join(SCRIPT_DIR, '.cache')) if diskcache else None
+
+
+def _cache_get(key: str):
+    """Read a value from the disk cache; returns None when caching is off."""
+    return _CACHE.get(key) if _CACHE is not None else None
+
+
+def _cache_set(key: str, value, expire: int = _CACHE_TTL):
+    """Store a value in the disk cache (no-op when caching is off)."""
+    if _CACHE is not None:
+        _CACHE.set(key, value, expire=expire)
+
 
 # ═══════════════════════════════════════════════════════════════════════
 #  ENVIRONMENT CHECK
@@ -273,24 +332,33 @@ def _animated_startup():
     print(f"  {g_blue}{C.BO}⬢{C.E}  {C.W}{C.BO}Installing | updating dependencies...{C.E}")
     print(f"  {C.DM}{'─' * 46}{C.E}\n")
 
+    def _pip_upgrade(pkg):
+        return subprocess.run(
+            [sys.executable, '-m', 'pip', 'install', '--upgrade', pkg],
+            capture_output=True, text=True, timeout=60,
+        )
+
+    # Both pip runs are network-bound and independent — start them all at
+    # once and let the animation below track each one to completion, so
+    # startup waits for the slowest check instead of the sum of both.
+    pool = ThreadPoolExecutor(max_workers=len(deps))
+    futures = {pkg: pool.submit(_pip_upgrade, pkg) for pkg, _ in deps}
+
     for idx, (pkg, label) in enumerate(deps):
-        # Animate progress bar filling up
-        total_steps = 20
-        for step in range(total_steps + 1):
-            progress = step / total_steps
+        # Animate the progress bar while this package's upgrade runs
+        fut = futures[pkg]
+        progress = 0.0
+        while not fut.done():
+            progress = min(progress + 0.05, 0.95)
             bar = _progress_bar_str(progress, 30, g_cyan if idx == 0 else g_green)
             pct = int(progress * 100)
             spinner = next(_spinner_gen)
-            status_text = 'checking' if step < total_steps // 2 else 'updating'
+            status_text = 'checking' if progress < 0.5 else 'updating'
             print(f"\r  {g_cyan}{spinner}{C.E}  {C.W}{label}{C.E}  {bar}  {C.DM}{pct:3d}%{C.E}  {C.DG}{status_text}{C.E}   ", end='', flush=True)
-            time.sleep(0.02)
+            time.sleep(0.05)
 
-        # Actually check / update the package
         try:
-            result = subprocess.run(
-                [sys.executable, '-m', 'pip', 'install', '--upgrade', pkg],
-                capture_output=True, text=True, timeout=60,
-            )
+            result = fut.result()
             if 'Successfully installed' in result.stdout:
                 ver = ''
                 for word in result.stdout.split():
@@ -309,6 +377,8 @@ def _animated_startup():
         bar_done = _progress_bar_str(1.0, 30, g_green)
         print(f"\r  {status_icon}  {C.W}{label}{C.E}  {bar_done}  {C.DM}100%{C.E}  {status_msg}           ")
 
+    pool.shutdown(wait=False)
+
     # ── Phase 2: Environment check ───────────────────────────────────
     print(f"\n  {g_blue}{C.BO}⬢{C.E}  {C.W}{C.BO}Checking environment...{C.E}")
     print(f"  {C.DM}{'─' * 46}{C.E}")
@@ -369,19 +439,54 @@ def _animated_startup():
 _spinner_gen = _spinner_frames()
 
 
+# Compiled once at import — these run per video on the parse and batch
+# paths, so skip the per-call pattern-cache lookup inside the re module.
+_ILLEGAL_RE = re.compile(r'[\\/:*?"<>|]')
+_VID_RE     = re.compile(r'(?:v=|youtu\.be/)([\w-]{11})')
+
+
 def safe_filename(name: str) -> str:
     """Remove characters illegal on Windows, keep Unicode letters."""
-    name = re.sub(r'[\\/:*?"<>|]', '', name)
+    name = _ILLEGAL_RE.sub('', name)
     name = name.strip('. ')
     return name if name else 'untitled'
 
 
 def parse_iso_duration(iso: str) -> int:
-    """PT1H2M3S → seconds."""
-    m = re.match(r'PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?', iso or '')
-    if not m:
-        return 0
-    return int(m.group(1) or 0) * 3600 + int(m.group(2) or 0) * 60 + int(m.group(3) or 0)
+    """ISO-8601 duration (PT1H2M3S, P1DT2H...) → seconds.
+
+    Single pass over the ~10-byte string with a digit accumulator instead
+    of a regex — this is the hottest string helper when classifying large
+    channels. Unlike the old PT-only regex it also handles the day field
+    YouTube returns for streams longer than 24 hours.
+    """
+    total = 0
+    n = 0
+    in_time = False
+    for c in iso or '':
+        if '0' <= c <= '9':
+            n = n * 10 + (ord(c) - 48)
+        elif c == 'T':
+            in_time = True
+            n = 0
+        elif c == 'D':
+            total += n * 86400
+            n = 0
+        elif c == 'H':
+            total += n * 3600
+            n = 0
+        elif c == 'M':
+            # 'M' before the T separator would be months — never emitted
+            # for video durations, so only count minutes.
+            if in_time:
+                total += n * 60
+            n = 0
+        elif c == 'S':
+            total += n
+            n = 0
+        else:  # 'P' or anything unexpected
+            n = 0
+    return total
 
 
 # ═══════════════════════════════════════════════════════════════════════
@@ -418,6 +523,11 @@ class KeyManager:
     def __init__(self, path: str):
         self.keys = self._load(path)
         self.idx  = 0
+        # Service objects cached per (thread, key) — building a Resource
+        # parses the discovery document every time (~100-300 ms), which
+        # dominates cheap calls like videos.list. Thread-local because
+        # httplib2 connections are not safe to share across threads.
+        self._services = threading.local()
         print(f"  {C.G}{C.BO}✓{C.E}  {C.G}Loaded {len(self.keys)} API key(s){C.E}")
 
     def _load(self, path: str):
@@ -435,33 +545,65 @@ class KeyManager:
     def key(self) -> str:
         return self.keys[self.idx]
 
+    def service(self):
+        """Return a cached youtube service object for the current key.
+
+        static_discovery=True uses the discovery document bundled with
+        googleapiclient, so no network round-trip is needed to build.
+        """
+        by_key = getattr(self._services, 'by_key', None)
+        if by_key is None:
+            by_key = self._services.by_key = {}
+        key = self.key()
+        if key not in by_key:
+            yt = build('youtube', 'v3', developerKey=key,
+                       cache_discovery=False, static_discovery=True)
+            _install_etag_http(yt)
+            by_key[key] = yt
+        return by_key[key]
+
     def rotate(self):
         self.idx = (self.idx + 1) % len(self.keys)
         print(f"  {C.Y}⟳  Switched to key #{self.idx + 1}{C.E}")
 
 
 def check_key_quotas(km: KeyManager):
-    """Test each API key with a lightweight call and show status."""
+    """Test each API key with a lightweight call and show status.
+
+    All keys are probed concurrently, so startup cost stays flat instead
+    of growing by one round-trip per key. Each worker builds its own
+    service object (thread-safe isolation).
+    """
     _ui_header('API Key Status', C.CN)
-    first_valid = None
-    for i, api_key in enumerate(km.keys):
+
+    def _probe(api_key):
+        """Return (status_str, is_valid) for one key.
+
+        i18nLanguages.list costs 1 quota unit (vs. 100 for search.list)
+        and still returns 403 for disabled/exhausted keys.
+        """
         try:
             yt = build('youtube', 'v3', developerKey=api_key)
-            yt.search().list(part="id", q="test", maxResults=1).execute()
-            status = f"{C.G}{C.BO}✓{C.E} {C.G}Active{C.E}"
-            if first_valid is None:
-                first_valid = i
+            yt.i18nLanguages().list(part="snippet").execute()
+            return f"{C.G}{C.BO}✓{C.E} {C.G}Active{C.E}", True
         except HttpError as e:
             if e.resp.status in (403, 429):
-                status = f"{C.R}{C.BO}✗{C.E} {C.R}Quota exhausted{C.E}"
-            elif e.resp.status == 400:
-                status = f"{C.R}{C.BO}✗{C.E} {C.R}Invalid key{C.E}"
-            else:
-                status = f"{C.Y}? HTTP {e.resp.status}{C.E}"
+                return f"{C.R}{C.BO}✗{C.E} {C.R}Quota exhausted{C.E}", False
+            if e.resp.status == 400:
+                return f"{C.R}{C.BO}✗{C.E} {C.R}Invalid key{C.E}", False
+            return f"{C.Y}? HTTP {e.resp.status}{C.E}", False
         except Exception as e:
-            status = f"{C.Y}? Error: {e}{C.E}"
+            return f"{C.Y}? Error: {e}{C.E}", False
+
+    with ThreadPoolExecutor(max_workers=len(km.keys)) as ex:
+        results = list(ex.map(_probe, km.keys))
+
+    first_valid = None
+    for i, (api_key, (status, is_valid)) in enumerate(zip(km.keys, results)):
+        if is_valid and first_valid is None:
+            first_valid = i
         print(f"  {C.DG}│{C.E} Key #{i+1} {C.DM}(...{api_key[-6:]}){C.E}  {status}")
-    
+
     if first_valid is not None:
         km.idx = first_valid
         print(f"  {C.G}{C.BO}→{C.E} {C.W}Using key #{first_valid + 1} as starting key{C.E}")
@@ -474,6 +616,43 @@ def check_key_quotas(km: KeyManager):
 #  GENERIC API CALL WITH KEY ROTATION
 # ═══════════════════════════════════════════════════════════════════════
 
+def _install_etag_http(yt):
+    """Wrap a service's HTTP layer with ETag revalidation.
+
+    GET responses carrying an ETag are stored in the disk cache keyed by
+    request URI; subsequent identical requests send If-None-Match, and a
+    304 Not Modified is answered from the cached body without transferring
+    the full payload again.
+    """
+    if _CACHE is None or getattr(yt._http, '_etag_wrapped', False):
+        return
+    http = yt._http
+    orig_request = http.request
+
+    def request(uri, method='GET', body=None, headers=None, **kwargs):
+        if method != 'GET':
+            return orig_request(uri, method=method, body=body,
+                                headers=headers, **kwargs)
+        cached = _cache_get(f'etag:{uri}')
+        if cached is not None:
+            headers = dict(headers or {})
+            headers['If-None-Match'] = cached[0]
+        resp, content = orig_request(uri, method=method, body=body,
+                                     headers=headers, **kwargs)
+        if resp.status == 304 and cached is not None:
+            # Not modified — serve the cached body as a normal 200 so
+            # googleapiclient's execute() does not treat it as an error
+            resp.status = 200
+            return resp, cached[1]
+        etag = resp.get('etag')
+        if resp.status == 200 and etag:
+            _cache_set(f'etag:{uri}', (etag, content), expire=7 * 86400)
+        return resp, content
+
+    http.request = request
+    http._etag_wrapped = True
+
+
 def api_call(km: KeyManager, build_fn):
     """
     build_fn(youtube_service) → request object.
@@ -483,8 +662,7 @@ def api_call(km: KeyManager, build_fn):
     attempts = 0
     while attempts < len(km.keys):
         try:
-            yt = build('youtube', 'v3', developerKey=km.key())
-            return build_fn(yt).execute()
+            return build_fn(km.service()).execute()
         except HttpError as e:
             code = e.resp.status
             if code in (403, 429, 400):
@@ -547,8 +725,70 @@ def ask_filters() -> dict:
                 published_after=pub_after, language=lang, page_size=page_size)
 
 
+def _filter_results_locally(km: KeyManager, items: list, filters: dict) -> list:
+    """Apply duration/quality filters client-side via videos().list.
+
+    The Search endpoint's videoDuration/videoDefinition parameters filter
+    server-side on randomized result sets and every filtered page still
+    costs 100 units. Instead, hydrate the found IDs with contentDetails
+    (1 unit per 50 IDs, and already disk-cached at the HTTP layer) and
+    filter here — stable, cheap, and the thresholds are explicit.
+    """
+    if filters['duration'] == 'any' and filters['definition'] == 'any':
+        return items
+
+    ids = [it['id']['videoId'] for it in items if it['id'].get('videoId')]
+    details = {}
+    unhydrated = set()
+    for i in range(0, len(ids), 50):
+        chunk = ids[i:i + 50]
+        ids_str = ','.join(chunk)
+        resp = api_call(km, lambda yt: yt.videos().list(
+            part="contentDetails", id=ids_str,
+            fields="items(id,contentDetails(duration,definition))"))
+        if not resp:
+            # Hydration failed (quota/network) — remember these IDs so the
+            # items pass through unfiltered instead of silently vanishing.
+            unhydrated.update(chunk)
+            continue
+        for it in resp.get('items', []):
+            details[it['id']] = it.get('contentDetails', {})
+
+    dur_ok = {
+        'any':    lambda s: True,
+        'short':  lambda s: s < 240,
+        'medium': lambda s: 240 <= s <= 1200,
+        'long':   lambda s: s > 1200,
+    }[filters['duration']]
+    want_def = {'standard': 'sd', 'high': 'hd'}.get(filters['definition'])
+
+    out = []
+    for it in items:
+        vid = it['id'].get('videoId')
+        cd = details.get(vid)
+        if cd is None:
+            # Keep items whose details could not be fetched; only drop
+            # videos the API confirmed have no contentDetails.
+            if vid in unhydrated:
+                out.append(it)
+            continue
+        if not dur_ok(parse_iso_duration(cd.get('duration', 'PT0S'))):
+            continue
+        if want_def and cd.get('definition') != want_def:
+            continue
+        out.append(it)
+    if unhydrated:
+        print(f"  {C.Y}⚠  Could not fetch details for {len(unhydrated)} "
+              f"video(s) — included without duration/quality filtering.{C.E}")
+    return out
+
+
 def search_youtube_all(km: KeyManager, query: str, filters: dict) -> list:
-    """Fetch ALL YouTube search results using nextPageToken pagination."""
+    """Fetch ALL YouTube search results using nextPageToken pagination.
+
+    Duration and quality filters are applied locally afterwards (see
+    _filter_results_locally); only date and language stay on search.list.
+    """
     all_items = []
     page_token = None
     total_reported = None
@@ -556,11 +796,10 @@ def search_youtube_all(km: KeyManager, query: str, filters: dict) -> list:
     while True:
         def req(yt, pt=page_token):
             params = dict(part="snippet", maxResults=50,
-                          q=query, type="video")
-            if filters['duration'] != 'any':
-                params['videoDuration'] = filters['duration']
-            if filters['definition'] != 'any':
-                params['videoDefinition'] = filters['definition']
+                          q=query, type="video",
+                          fields="nextPageToken,pageInfo/totalResults,"
+                                 "items(id/videoId,snippet(title,channelId,"
+                                 "channelTitle,publishedAt))")
             if filters['published_after']:
                 params['publishedAfter'] = filters['published_after']
             if filters['language']:
@@ -586,26 +825,41 @@ def search_youtube_all(km: KeyManager, query: str, filters: dict) -> list:
 
         print(f"  {C.DM}⟳  Fetched {len(all_items)} so far...{C.E}")
 
-    return all_items
+    return _filter_results_locally(km, all_items, filters)
 
 
 def get_channel_stats(km: KeyManager, channel_ids: list) -> dict:
-    """Fetch channel statistics for a list of IDs."""
+    """Fetch channel statistics for a list of IDs (disk-cached for 24 h)."""
     if not channel_ids:
         return {}
+
+    out = {}
+    misses = []
+    for cid in channel_ids[:50]:
+        cached = _cache_get(f'channel:{cid}')
+        if cached is not None:
+            out[cid] = cached
+        else:
+            misses.append(cid)
+    if not misses:
+        return out
+
     resp = api_call(km, lambda yt: yt.channels().list(
-        part="snippet,statistics", id=','.join(channel_ids[:50])))
+        part="snippet,statistics", id=','.join(misses),
+        fields="items(id,snippet/title,"
+               "statistics(subscriberCount,videoCount,viewCount))"))
     if not resp:
-        return {}
-    out = {}
+        return out
     for it in resp.get('items', []):
         s = it.get('statistics', {})
-        out[it['id']] = dict(
+        entry = dict(
             title=it['snippet']['title'],
             subs=s.get('subscriberCount', '?'),
             vids=s.get('videoCount', '?'),
             views=s.get('viewCount', '?'),
         )
+        out[it['id']] = entry
+        _cache_set(f"channel:{it['id']}", entry)
     return out
 
 
@@ -676,44 +930,159 @@ def display_results_paginated(results: list, ch_stats: dict, page_size: int = 25
             _ui_separator()
 
 
+_THUMB_SESSION = None
+
+
+def _thumb_session() -> requests.Session:
+    """Shared pooled session for img.youtube.com, created on first use.
+
+    One session serves every thumbnail path (search, channel, playlist,
+    single video), so keep-alive connections survive across modes and only
+    the first few requests pay the TCP+TLS handshake cost.
+    """
+    global _THUMB_SESSION
+    if _THUMB_SESSION is None:
+        sess = requests.Session()
+        retry = requests.adapters.Retry(total=2, backoff_factor=0.2)
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=16, pool_maxsize=32, max_retries=retry)
+        sess.mount('https://', adapter)
+        _THUMB_SESSION = sess
+    return _THUMB_SESSION
+
+
+def _fetch_thumbnail(sess: requests.Session, vid: str, fname: str) -> bool:
+    """Download the best available thumbnail for a video ID to fname.
+
+    A cheap HEAD on maxresdefault picks between maxres and hqdefault
+    before any body bytes move — maxres only exists for HD uploads, so
+    the placeholder body would otherwise be transferred just to be
+    discarded. The chosen body then streams straight to disk.
+
+    Returns True if the file was downloaded, False if a previous run
+    already left a plausible thumbnail at fname (re-runs against the same
+    channel become a filesystem scan).
+    """
+    if os.path.isfile(fname) and os.path.getsize(fname) >= 5000:
+        return False
+    maxres_url = f"https://img.youtube.com/vi/{vid}/maxresdefault.jpg"
+    hq_url = f"https://img.youtube.com/vi/{vid}/hqdefault.jpg"
+    try:
+        head = sess.head(maxres_url, timeout=5)
+        has_maxres = (head.status_code == 200
+                      and int(head.headers.get('Content-Length', '0')) >= 5000)
+    except requests.RequestException:
+        has_maxres = True  # HEAD failed — let the GET's own check decide
+
+    resp = sess.get(maxres_url if has_maxres else hq_url, stream=True,
+                    timeout=10)
+    try:
+        if has_maxres and (resp.status_code != 200
+                           or int(resp.headers.get('Content-Length', '0')) < 5000):
+            resp.close()
+            resp = sess.get(hq_url, stream=True, timeout=10)
+        resp.raise_for_status()
+        # 1 MiB file buffer + 64 KiB copy chunks: a typical thumbnail hits
+        # disk in a single write() syscall instead of ~8 KiB pieces
+        with open(fname, 'wb', buffering=1 << 20) as f:
+            shutil.copyfileobj(resp.raw, f, 1 << 16)
+    finally:
+        resp.close()
+    return True
+
+
 def download_thumbnails_search(results: list):
-    """Download max-res thumbnails named by video title."""
+    """Download max-res thumbnails named by video title (16 parallel workers)."""
     os.makedirs(THUMBS_DIR, exist_ok=True)
-    count = 0
+
+    jobs = []  # (vid, title, fname)
     for it in results:
         vid = it['id'].get('videoId')
         if not vid:
             continue
         title = safe_filename(it['snippet']['title'])
-        # maxresdefault gives highest quality; fallback to hqdefault
         fname = os.path.join(THUMBS_DIR, f"{title} [{vid}].jpg")
-        url = f"https://img.youtube.com/vi/{vid}/maxresdefault.jpg"
-        try:
-            urllib.request.urlretrieve(url, fname)
-            if os.path.getsize(fname) < 5000:
-                url = f"https://img.youtube.com/vi/{vid}/hqdefault.jpg"
-                urllib.request.urlretrieve(url, fname)
-            count += 1
-            print(f"  {C.G}✓{C.E}  {title}")
-        except Exception as e:
-            print(f"  {C.R}✗  {vid}: {e}{C.E}")
+        jobs.append((vid, title, fname))
+
+    count = 0
+    sess = _thumb_session()
+    with ThreadPoolExecutor(max_workers=16) as ex:
+        futs = {ex.submit(_fetch_thumbnail, sess, vid, fname): (vid, title)
+                for vid, title, fname in jobs}
+        for fut in as_completed(futs):
+            vid, title = futs[fut]
+            try:
+                fresh = fut.result()
+                count += 1
+                mark = '' if fresh else f"  {C.DM}↷ cached{C.E}"
+                print(f"  {C.G}✓{C.E}  {title}{mark}")
+            except Exception as e:
+                print(f"  {C.R}✗  {vid}: {e}{C.E}")
     _ui_separator()
     print(f"  {C.G}{C.BO}✦{C.E}  {C.G}Downloaded {count} thumbnail(s) → {THUMBS_DIR}{C.E}")
     _ui_separator()
 
 
+# Video IDs already written to find.txt, loaded lazily from find.idx.
+# O(1) membership tests beat re-reading a multi-MB find.txt per save.
+_saved_vids = None
+
+
+def _load_saved_vids() -> set:
+    """Load (once) the set of video IDs already present in find.txt."""
+    global _saved_vids
+    if _saved_vids is None:
+        _saved_vids = set()
+        if os.path.isfile(OUTPUT_INDEX):
+            with open(OUTPUT_INDEX, 'r', encoding='utf-8') as f:
+                _saved_vids = {line.strip() for line in f if line.strip()}
+        elif os.path.isfile(OUTPUT_FILE):
+            # No index yet (install predates find.idx) — backfill it from
+            # the IDs already in find.txt so old links aren't re-appended.
+            with open(OUTPUT_FILE, 'r', encoding='utf-8') as f:
+                _saved_vids = {m.group(1) for m in _VID_RE.finditer(f.read())}
+            if _saved_vids:
+                try:
+                    with open(OUTPUT_INDEX, 'w', encoding='utf-8') as f:
+                        f.write('\n'.join(_saved_vids) + '\n')
+                except OSError:
+                    pass  # in-memory set still dedups this session
+    return _saved_vids
+
+
 def save_results(results: list, query: str):
-    """Append ALL search results to find.txt — URLs only, one per line."""
-    count = 0
+    """Append NEW search results to find.txt — URLs only, one per line.
+
+    A companion find.idx file records every videoId ever written, so
+    overlapping queries no longer grow find.txt with duplicates.
+    """
+    seen = _load_saved_vids()
+    new_vids = []
+    skipped = 0
+    for it in results:
+        vid = it['id'].get('videoId')
+        if not vid:
+            continue
+        if vid in seen:
+            skipped += 1
+            continue
+        seen.add(vid)
+        new_vids.append(vid)
+
+    if not new_vids:
+        print(f"  {C.Y}All {skipped} link(s) already in {OUTPUT_FILE} — nothing added.{C.E}")
+        return
+
+    urls = [f"https://www.youtube.com/watch?v={vid}" for vid in new_vids]
     try:
+        # One write() for the whole block instead of one per line
         with open(OUTPUT_FILE, 'a', encoding='utf-8') as f:
             f.write(f"\n--- [{datetime.now().strftime('%Y-%m-%d %H:%M')}] {query} ---\n")
-            for it in results:
-                vid = it['id'].get('videoId')
-                if vid:
-                    f.write(f"https://www.youtube.com/watch?v={vid}\n")
-                    count += 1
-        print(f"  {C.G}✓{C.E}  {C.G}Saved {count} link(s) → {OUTPUT_FILE}{C.E}")
+            f.write('\n'.join(urls) + '\n')
+        with open(OUTPUT_INDEX, 'a', encoding='utf-8') as f:
+            f.write('\n'.join(new_vids) + '\n')
+        extra = f" {C.DM}({skipped} duplicate(s) skipped){C.E}" if skipped else ''
+        print(f"  {C.G}✓{C.E}  {C.G}Saved {len(urls)} link(s) → {OUTPUT_FILE}{C.E}{extra}")
     except Exception as e:
         print(f"  {C.R}✗  Save error: {e}{C.E}")
 
@@ -726,6 +1095,7 @@ def _pick_quality() -> dict:
     _ui_menu_item('3', '480p', C.CN, 'MP4')
     _ui_menu_item('4', 'Audio only', C.Y, 'MP3 192kbps')
     _ui_menu_item('5', 'Ultra High', C.H, '4K | 8K')
+    _ui_menu_item('6', 'Re-encode 1080p', C.Y, 'force H.264 MP4')
     q = _ui_prompt()
 
     opts = {}
@@ -747,17 +1117,33 @@ def _pick_quality() -> dict:
     elif q == '5':
         # Sentinel — actual format resolved per-URL after probing
         opts['_quality_mode'] = 'ultra_high'
+    elif q == '6':
+        # Explicit re-encode for players that choke on VP9/AV1 in MP4.
+        # This is the only path that uses VideoConvertor (a full ffmpeg
+        # encode); every other video mode stream-copies via the remuxer.
+        opts['format'] = ('bestvideo[height<=1080]+bestaudio'
+                          '/bestvideo*[height<=1080]+bestaudio'
+                          '/best[height<=1080]/best/worst')
+        opts['merge_output_format'] = 'mp4'
+        opts['postprocessors'] = [{
+            'key': 'FFmpegVideoConvertor',
+            'preferedformat': 'mp4',
+        }]
+        opts['_reencode_height'] = 1080
     else:
         # 1080p cap with full fallback chain
         opts['format'] = ('bestvideo[height<=1080]+bestaudio'
                           '/bestvideo*[height<=1080]+bestaudio'
                           '/best[height<=1080]/best/worst')
 
-    # For video modes (not audio-only and not ultra_high sentinel), add MP4 postprocessor
-    if q not in ('4', '5'):
+    # For video modes (not audio-only, ultra_high sentinel or forced
+    # re-encode), add MP4 postprocessor. Remuxer does a container-level
+    # stream copy — no re-encode — which is enough since YouTube streams
+    # are already H.264/AAC (or VP9/Opus, which MP4 also carries).
+    if q not in ('4', '5', '6'):
         opts['merge_output_format'] = 'mp4'
         opts['postprocessors'] = opts.get('postprocessors', []) + [{
-            'key': 'FFmpegVideoConvertor',
+            'key': 'FFmpegVideoRemuxer',
             'preferedformat': 'mp4',
         }]
 
@@ -1336,6 +1722,34 @@ def _is_bot_error(msg: str) -> bool:
     return any(sig in msg_lower for sig in _BOT_SIGNALS)
 
 
+# Hardware H.264 encoders in preference order (NVIDIA, Intel, Apple)
+_HWENC_CANDIDATES = ('h264_nvenc', 'h264_qsv', 'h264_videotoolbox')
+_hwenc_cache = {'probed': False, 'encoder': None}
+# Target bitrate by capped resolution for forced re-encodes
+_HWENC_BITRATES = {480: '2.5M', 720: '5M', 1080: '8M', 1440: '12M', 2160: '20M'}
+
+
+def _detect_hwenc() -> str | None:
+    """Return the first hardware H.264 encoder this ffmpeg offers, or None.
+
+    Probes `ffmpeg -encoders` once per run and caches the result.
+    """
+    if not _hwenc_cache['probed']:
+        _hwenc_cache['probed'] = True
+        try:
+            result = subprocess.run(
+                ['ffmpeg', '-hide_banner', '-encoders'],
+                capture_output=True, text=True, timeout=10,
+            )
+            for enc in _HWENC_CANDIDATES:
+                if enc in result.stdout:
+                    _hwenc_cache['encoder'] = enc
+                    break
+        except Exception:
+            pass  # no ffmpeg on PATH — software encoding will apply
+    return _hwenc_cache['encoder']
+
+
 def _build_ydl_opts(out_dir: str, quality_opts: dict, cookie_opts: dict) -> dict:
     """Assemble the full yt-dlp options dict."""
     template = os.path.join(out_dir, '%(title)s [%(id)s].%(ext)s')
@@ -1355,8 +1769,25 @@ def _build_ydl_opts(out_dir: str, quality_opts: dict, cookie_opts: dict) -> dict
         'js_runtimes':      {'node': {}},
         # Download EJS challenge solver from GitHub (required to decrypt YouTube stream URLs)
         'remote_components': ['ejs:github'],
+        # Fetch DASH/HLS fragments concurrently instead of one at a time
+        'concurrent_fragment_downloads': 8,
+        'fragment_retries':  10,
+        'http_chunk_size':   10485760,  # 10 MiB chunks for unfragmented streams
     }
     opts.update(quality_opts)
+    # When a real re-encode is requested (VideoConvertor, only set by the
+    # forced re-encode quality option — every other mode stream-copies),
+    # route it through a hardware encoder if this ffmpeg has one —
+    # several times faster than software libx264.
+    height = opts.pop('_reencode_height', 1080)
+    pps = opts.get('postprocessors', [])
+    if any(pp.get('key') == 'FFmpegVideoConvertor' for pp in pps):
+        hwenc = _detect_hwenc()
+        if hwenc:
+            bitrate = _HWENC_BITRATES.get(height, '8M')
+            # yt-dlp matches postprocessor_args keys in lower case
+            opts.setdefault('postprocessor_args', {})['videoconvertor'] = \
+                ['-c:v', hwenc, '-b:v', bitrate]
     # Apply cookie options (strip our internal meta keys)
     for k, v in cookie_opts.items():
         if not k.startswith('_'):
@@ -1402,14 +1833,11 @@ def _download_one(ydl, url: str, i: int, total: int, out_dir: str,
     _ui_separator()
     # Reset phase tracker for this URL (video → audio → merge)
     _dl_phase_reset()
-    # download() runs the full pipeline: format selection + download + post-process
-    ydl.download([url])
-    # For metadata, re-fetch with full processing (no download) to get resolved fields
-    try:
-        info = ydl.extract_info(url, download=False)
-        _save_video_metadata(info or raw, out_dir)
-    except Exception:
-        _save_video_metadata(raw, out_dir)  # use raw info as fallback
+    # One extract_info(download=True) pass runs format selection + download
+    # + post-processing AND returns the fully resolved info dict, so no
+    # second extraction is needed for the metadata file.
+    info = ydl.extract_info(url, download=True)
+    _save_video_metadata(info or raw, out_dir)
     # Remove from videolinks.txt if this batch came from there
     if from_videolinks:
         _remove_url_from_videolinks(url)
@@ -1418,6 +1846,42 @@ def _download_one(ydl, url: str, i: int, total: int, out_dir: str,
     return True
 
 
+# Batches of at least this many URLs download on parallel worker threads.
+# Kept small to stay under YouTube's per-IP throttling radar.
+_PARALLEL_DL_THRESHOLD = 4
+_PARALLEL_DL_WORKERS = 4
+
+
+def _parallel_download_worker(base_opts: dict, url: str, i: int, total: int,
+                              out_dir: str, from_videolinks: bool,
+                              lock: threading.Lock):
+    """Download one URL on a worker thread. Returns (url, error_msg|None).
+
+    The animated progress/postprocessor hooks track global per-stream
+    state, so they are stripped here — workers report one status line per
+    video instead, serialized through the shared print lock.
+    """
+    from yt_dlp import YoutubeDL
+    opts = dict(base_opts)
+    opts.pop('progress_hooks', None)
+    opts.pop('postprocessor_hooks', None)
+    try:
+        with YoutubeDL(opts) as ydl:
+            info = ydl.extract_info(url, download=True)
+        with lock:
+            title = (info or {}).get('title', url)
+            print(f"  {C.G}✓{C.E}  {C.DM}[{i}/{total}]{C.E}  {C.W}{title}{C.E}")
+            _save_video_metadata(info, out_dir)
+            if from_videolinks:
+                _remove_url_from_videolinks(url)
+        return url, None
+    except Exception as e:
+        err_msg = str(e)
+        with lock:
+            print(f"  {C.R}✗{C.E}  {C.DM}[{i}/{total}]{C.E}  {C.R}{err_msg[:160]}{C.E}")
+        return url, err_msg
+
+
 def _cleanup_tmp_cookie_db(cookie_opts: dict):
     """Delete the temp cookie DB file if one was created."""
     tmp = cookie_opts.get('_tmp_cookie_db')
@@ -1474,7 +1938,7 @@ def _download_urls(urls: list, out_dir: str, from_videolinks: bool = False):
 
     # ── Ultra High (4K/8K) mode — probe + resolve format per URL ────────
     if quality_opts.pop('_quality_mode', None) == 'ultra_high':
-        uhd_pp = [{'key': 'FFmpegVideoConvertor', 'preferedformat': 'mp4'}]
+        uhd_pp = [{'key': 'FFmpegVideoRemuxer', 'preferedformat': 'mp4'}]
         failed_urls = []
         try:
             from yt_dlp import YoutubeDL
@@ -1530,27 +1994,52 @@ def _download_urls(urls: list, out_dir: str, from_videolinks: bool = False):
     failed_urls = []
 
     try:
-        with YoutubeDL(base_opts) as ydl:
-            for i, url in enumerate(urls, 1):
-                try:
-                    _download_one(ydl, url, i, len(urls), out_dir,
-                                  from_videolinks=from_videolinks)
-                except Exception as e:
-                    err_msg = str(e)
-
-                    # Cookie database locked / copy error
+        if len(urls) >= _PARALLEL_DL_THRESHOLD:
+            # Large batch: download on worker threads, one status line per
+            # video (the animated bars only make sense for serial output).
+            print_lock = threading.Lock()
+            cookie_db_failed = False
+            with ThreadPoolExecutor(max_workers=_PARALLEL_DL_WORKERS) as ex:
+                futs = [ex.submit(_parallel_download_worker, base_opts, url,
+                                  i, len(urls), out_dir, from_videolinks,
+                                  print_lock)
+                        for i, url in enumerate(urls, 1)]
+                for fut in as_completed(futs):
+                    url, err_msg = fut.result()
+                    if err_msg is None:
+                        continue
                     if _is_cookie_db_error(err_msg):
-                        _print_cookie_db_help(browser_name)
-                        break  # no point continuing, all URLs will hit the same error
+                        cookie_db_failed = True
+                    elif _is_bot_error(err_msg) and cookie_mode == 'none':
+                        failed_urls.append(url)
+            if cookie_db_failed:
+                _print_cookie_db_help(browser_name)
+                failed_urls = []
+            elif failed_urls:
+                print(f"  {C.Y}↳ Bot/auth block on {len(failed_urls)} video(s) — "
+                      f"will retry with browser cookies.{C.E}")
+        else:
+            with YoutubeDL(base_opts) as ydl:
+                for i, url in enumerate(urls, 1):
+                    try:
+                        _download_one(ydl, url, i, len(urls), out_dir,
+                                      from_videolinks=from_videolinks)
+                    except Exception as e:
+                        err_msg = str(e)
 
-                    print(f"\n  {C.R}✗  Error: {err_msg[:200]}{C.E}")
+                        # Cookie database locked / copy error
+                        if _is_cookie_db_error(err_msg):
+                            _print_cookie_db_help(browser_name)
+                            break  # no point continuing, all URLs will hit the same error
 
-                    # If it looks like a bot block and we're not already using cookies
-                    if _is_bot_error(err_msg) and cookie_mode == 'none':
-                        print(f"  {C.Y}↳ Bot/auth block detected — will retry with browser cookies.{C.E}")
-                        failed_urls.append(url)
-                    else:
-                        print()
+                        print(f"\n  {C.R}✗  Error: {err_msg[:200]}{C.E}")
+
+                        # If it looks like a bot block and we're not already using cookies
+                        if _is_bot_error(err_msg) and cookie_mode == 'none':
+                            print(f"  {C.Y}↳ Bot/auth block detected — will retry with browser cookies.{C.E}")
+                            failed_urls.append(url)
+                        else:
+                            print()
     finally:
         _cleanup_tmp_cookie_db(cookie_opts)
 
@@ -1660,7 +2149,7 @@ def mode_download_single(km: KeyManager):
             break
         elif ch == '2':
             # Extract video ID for thumbnail download
-            m = re.search(r'(?:v=|youtu\.be/)([\w-]{11})', url)
+            m = _VID_RE.search(url)
             if not m:
                 print(f"{C.R}  Could not extract video ID from URL.{C.E}")
                 break
@@ -1706,8 +2195,19 @@ def download_selected(results: list):
     _download_urls(urls, DOWNLOADS_DIR)
 
 
-def search_post_menu(results: list, query: str, km: KeyManager, page_size: int = 25) -> str:
-    """After-search actions. Returns 'search' to loop, 'menu' to go back."""
+def search_post_menu(results: list, query: str, km: KeyManager,
+                     page_size: int = 25, ch_stats: dict = None) -> str:
+    """After-search actions. Returns 'search' to loop, 'menu' to go back.
+
+    ch_stats is the channel-stats dict already computed for this result
+    set in mode_search; the results cannot change mid-session, so menu
+    actions reuse it instead of re-deriving channel IDs per keypress.
+    """
+    if ch_stats is None:
+        cids = list({it['snippet'].get('channelId', '')
+                     for it in results if it['snippet'].get('channelId')})
+        ch_stats = get_channel_stats(km, cids)
+
     while True:
         _ui_header(f'Actions ({len(results)} result(s) loaded)', C.CN)
         _ui_menu_item('1', 'Save ALL results → find.txt', C.G)
@@ -1723,21 +2223,15 @@ def search_post_menu(results: list, query: str, km: KeyManager, page_size: int =
             print(f"  {C.CN}⟳  Saving all {len(results)} result(s) to find.txt...{C.E}")
             save_results(results, query)
         elif ch == '2':
-            cids = list({it['snippet'].get('channelId', '')
-                         for it in results if it['snippet'].get('channelId')})
-            ch_stats = get_channel_stats(km, cids)
             display_results_paginated(results, ch_stats, page_size)
         elif ch == '3':
             download_thumbnails_search(results)
         elif ch == '4':
             download_selected(results)
         elif ch == '5':
-            cids = list({it['snippet'].get('channelId', '')
-                         for it in results if it['snippet'].get('channelId')})
-            stats = get_channel_stats(km, cids)
-            if stats:
+            if ch_stats:
                 _ui_header('Channel Analytics', C.B)
-                for cid, s in stats.items():
+                for cid, s in ch_stats.items():
                     print(f"  {C.DG}│{C.E} {C.CN}{s['title']}{C.E}")
                     print(f"  {C.DG}│{C.E}  {C.DM}Subs: {C.E}{C.W}{s['subs']}{C.E}  "
                           f"{C.DM}Videos: {C.E}{C.W}{s['vids']}{C.E}  "
@@ -1769,14 +2263,15 @@ def mode_search(km: KeyManager):
             print(f"  {C.Y}No results found.{C.E}")
             continue
 
-        # Fetch channel stats for the first batch to display alongside results
+        # Channel IDs / stats are computed once per result set and reused
+        # by every post-search action (display, analytics)
         cids = list({it['snippet'].get('channelId', '')
                      for it in results if it['snippet'].get('channelId')})
         ch_stats = get_channel_stats(km, cids)
 
         display_results_paginated(results, ch_stats, page_size)
 
-        action = search_post_menu(results, query, km, page_size)
+        action = search_post_menu(results, query, km, page_size, ch_stats)
         if action == 'menu':
             return
         # action == 'search' → loops back
@@ -1794,12 +2289,26 @@ def resolve_channel_id(km: KeyManager, user_input: str):
       @handle  (ASCII or Unicode, e.g. @ОльгаКиселёва)
       URL-encoded handles (e.g. @%D0%9E%D0%BB%D1%8C%D0%B3%D0%B0)
     Returns (channel_id, channel_title) or (None, None).
+    Successful resolutions are disk-cached for 24 h.
     """
     user_input = user_input.strip()
 
     # URL-decode so percent-encoded Unicode handles become readable
     user_input = urllib.parse.unquote(user_input)
 
+    cached = _cache_get(f'resolve:{user_input}')
+    if cached is not None:
+        return cached
+
+    cid, ctitle = _resolve_channel_id_uncached(km, user_input)
+    if cid:
+        _cache_set(f'resolve:{user_input}', (cid, ctitle))
+    return cid, ctitle
+
+
+def _resolve_channel_id_uncached(km: KeyManager, user_input: str):
+    """Resolve a channel ID/handle/search term against the API (no cache)."""
+
     # Direct channel URL
     m = re.search(r'youtube\.com/channel/(UC[\w-]+)', user_input)
     if m:
@@ -1836,14 +2345,16 @@ def resolve_channel_id(km: KeyManager, user_input: str):
     return None, None
 
 
-def fetch_all_channel_videos(km: KeyManager, channel_id: str) -> list:
-    """Paginate through ALL videos on a channel using the uploads playlist.
+def _iter_channel_video_pages(km: KeyManager, channel_id: str):
+    """Yield pages (lists of video dicts) from a channel's uploads playlist.
 
     Uses playlistItems().list() instead of search().list() because:
       - search().list() caps results at ~500 and costs 100 quota units/call
       - playlistItems().list() returns ALL videos and costs only 1 quota unit/call
 
     The uploads playlist ID is derived by replacing the 'UC' prefix with 'UU'.
+    Generator form lets consumers start working on the first page of 50
+    while later pages are still being fetched.
     """
     # Derive the uploads playlist ID from the channel ID
     if channel_id.startswith('UC'):
@@ -1854,22 +2365,23 @@ def fetch_all_channel_videos(km: KeyManager, channel_id: str) -> list:
             part="contentDetails", id=channel_id))
         if not resp or not resp.get('items'):
             print(f"{C.R}Could not resolve uploads playlist for channel.{C.E}")
-            return []
+            return
         uploads_playlist_id = (resp['items'][0]
                                .get('contentDetails', {})
                                .get('relatedPlaylists', {})
                                .get('uploads'))
         if not uploads_playlist_id:
             print(f"{C.R}Channel has no uploads playlist.{C.E}")
-            return []
+            return
 
-    videos = []
     page_token = None
 
     while True:
         def req(yt, pt=page_token):
-            params = dict(part="snippet", playlistId=uploads_playlist_id,
-                          maxResults=50)
+            params = dict(part="snippet,contentDetails",
+                          playlistId=uploads_playlist_id, maxResults=50,
+                          fields="nextPageToken,items(contentDetails/videoId,"
+                                 "snippet(title,publishedAt,resourceId/videoId))")
             if pt:
                 params['pageToken'] = pt
             return yt.playlistItems().list(**params)
@@ -1878,37 +2390,58 @@ def fetch_all_channel_videos(km: KeyManager, channel_id: str) -> list:
         if not resp:
             break
 
+        page = []
         for it in resp.get('items', []):
-            resource = it.get('snippet', {}).get('resourceId', {})
-            vid = resource.get('videoId')
+            vid = (it.get('contentDetails', {}).get('videoId')
+                   or it.get('snippet', {}).get('resourceId', {}).get('videoId'))
             if vid:
-                videos.append(dict(
+                page.append(dict(
                     videoId=vid,
                     title=it['snippet'].get('title', ''),
                     publishedAt=it['snippet'].get('publishedAt', ''),
                 ))
+        if page:
+            yield page
 
         page_token = resp.get('nextPageToken')
         if not page_token:
             break
-        print(f"  ... fetched {len(videos)} so far")
 
+
+def fetch_all_channel_videos(km: KeyManager, channel_id: str) -> list:
+    """Materialize ALL videos on a channel (see _iter_channel_video_pages)."""
+    videos = []
+    for page in _iter_channel_video_pages(km, channel_id):
+        videos.extend(page)
+        print(f"  ... fetched {len(videos)} so far")
     return videos
 
 
 def classify_videos(km: KeyManager, videos: list):
-    """Get durations via videos().list and split into longs (>60s) & shorts (≤60s)."""
-    longs, shorts = [], []
+    """Get durations via videos().list and split into longs (>60s) & shorts (≤60s).
 
-    for i in range(0, len(videos), 50):
-        chunk = videos[i:i + 50]
-        ids_str = ','.join(v['videoId'] for v in chunk)
+    Durations are cached on disk per video ID, so only IDs missing from the
+    cache are batched into videos().list calls. The 50-id chunks are
+    independent, so they are fetched on up to 8 worker threads instead of
+    one sequential round-trip per chunk.
+    """
+    entries = []
+    misses = []
+    for v in videos:
+        cached = _cache_get(f"video:{v['videoId']}")
+        if cached is not None:
+            entries.append(cached)
+        else:
+            misses.append(v)
 
+    def _fetch_chunk(chunk):
+        ids_str = ','.join(v['videoId'] for v in chunk)
         resp = api_call(km, lambda yt: yt.videos().list(
-            part="contentDetails,snippet", id=ids_str))
+            part="contentDetails,snippet", id=ids_str,
+            fields="items(id,snippet/title,contentDetails/duration)"))
+        out = []
         if not resp:
-            continue
-
+            return out
         for it in resp.get('items', []):
             dur = it.get('contentDetails', {}).get('duration', 'PT0S')
             secs = parse_iso_duration(dur)
@@ -1917,10 +2450,22 @@ def classify_videos(km: KeyManager, videos: list):
                 title=it['snippet']['title'],
                 seconds=secs,
             )
-            if secs <= 60:
-                shorts.append(entry)
-            else:
-                longs.append(entry)
+            out.append(entry)
+            _cache_set(f"video:{it['id']}", entry)
+        return out
+
+    chunks = [misses[i:i + 50] for i in range(0, len(misses), 50)]
+    if chunks:
+        with ThreadPoolExecutor(max_workers=min(8, len(chunks))) as ex:
+            for fut in as_completed([ex.submit(_fetch_chunk, c) for c in chunks]):
+                entries.extend(fut.result())
+
+    longs, shorts = [], []
+    for entry in entries:
+        if entry['seconds'] <= 60:
+            shorts.append(entry)
+        else:
+            longs.append(entry)
 
     return longs, shorts
 
@@ -1991,7 +2536,7 @@ def _download_thumbnails_for_urls(urls: list, channel_subdir: str):
             pass
 
     for i, url in enumerate(urls, 1):
-        m = re.search(r'(?:v=|youtu\.be/)([\w-]{11})', url)
+        m = _VID_RE.search(url)
         if not m:
             print(f"  {C.Y}⚠  Cannot extract video ID from: {url}{C.E}")
             continue
@@ -2004,14 +2549,11 @@ def _download_thumbnails_for_urls(urls: list, channel_subdir: str):
         else:
             fname = os.path.join(thumb_dir, f"{vid}.jpg")
             display = vid
-        img_url = f"https://img.youtube.com/vi/{vid}/maxresdefault.jpg"
         try:
-            urllib.request.urlretrieve(img_url, fname)
-            if os.path.getsize(fname) < 5000:
-                img_url = f"https://img.youtube.com/vi/{vid}/hqdefault.jpg"
-                urllib.request.urlretrieve(img_url, fname)
+            fresh = _fetch_thumbnail(_thumb_session(), vid, fname)
             ok += 1
-            print(f"  {C.G}[{i}/{total}] ✓{C.E} {display}")
+            mark = '' if fresh else f"  {C.DM}↷ cached{C.E}"
+            print(f"  {C.G}[{i}/{total}] ✓{C.E} {display}{mark}")
         except Exception as e:
             print(f"  {C.R}[{i}/{total}] ✗ {display}: {e}{C.E}")
     print(f"  {C.G}Thumbnails done: {ok}/{total} → {thumb_dir}{C.E}")
@@ -2098,13 +2640,12 @@ def mode_parse(km: KeyManager):
     long_urls  = [f"https://www.youtube.com/watch?v={v['videoId']}" for v in longs]
     short_urls = [f"https://www.youtube.com/watch?v={v['videoId']}" for v in shorts]
 
+    # Single joined write per file — one fwrite even for mega-channels
     with open(long_path, 'w', encoding='utf-8') as f:
-        for u in long_urls:
-            f.write(u + '\n')
+        f.write('\n'.join(long_urls) + '\n' if long_urls else '')
 
     with open(short_path, 'w', encoding='utf-8') as f:
-        for u in short_urls:
-            f.write(u + '\n')
+        f.write('\n'.join(short_urls) + '\n' if short_urls else '')
 
     print(f"  {C.G}✓{C.E}  {C.DM}Saved → {long_path}{C.E}")
     print(f"  {C.G}✓{C.E}  {C.DM}Saved → {short_path}{C.E}")
@@ -2155,9 +2696,16 @@ def mode_download():
         print(f"  {C.Y}+  Created empty template → {VIDEOLINKS}{C.E}")
         return
 
+    # One strip per line, and duplicate URLs download only once
+    seen = set()
+    urls = []
     with open(VIDEOLINKS, 'r', encoding='utf-8') as f:
-        urls = [line.strip() for line in f
-                if line.strip() and not line.strip().startswith('#')]
+        for line in f:
+            s = line.strip()
+            if not s or s[0] == '#' or s in seen:
+                continue
+            seen.add(s)
+            urls.append(s)
 
     if not urls:
         print(f"  {C.Y}⚠  No URLs in {VIDEOLINKS}{C.E}")
@@ -2181,36 +2729,110 @@ def _download_single_thumbnail(video_id: str, title: str):
     os.makedirs(THUMBS_DIR, exist_ok=True)
     safe_title = safe_filename(title)
     fname = os.path.join(THUMBS_DIR, f"{safe_title} [{video_id}].jpg")
-    url = f"https://img.youtube.com/vi/{video_id}/maxresdefault.jpg"
     try:
-        urllib.request.urlretrieve(url, fname)
-        if os.path.getsize(fname) < 5000:
-            url = f"https://img.youtube.com/vi/{video_id}/hqdefault.jpg"
-            urllib.request.urlretrieve(url, fname)
-        print(f"  {C.G}✓{C.E} {safe_title}")
+        fresh = _fetch_thumbnail(_thumb_session(), video_id, fname)
+        mark = '' if fresh else f"  {C.DM}↷ cached{C.E}"
+        print(f"  {C.G}✓{C.E} {safe_title}{mark}")
     except Exception as e:
         print(f"  {C.R}✗ {video_id}: {e}{C.E}")
 
 
+# Titles are effectively immutable for thumbnail naming — cache for 30 days
+_TITLE_TTL = 30 * 86400
+
+
+def _lookup_video_titles(km: KeyManager, vids: list) -> dict:
+    """Resolve video IDs to titles, disk-cached for 30 days.
+
+    Only IDs missing from the cache are batched into videos().list calls
+    (50 comma-separated IDs per 1-unit call); re-runs against the same
+    videos cost no quota at all. Stale revalidation of the underlying
+    responses is already handled by the ETag layer in api_call.
+    """
+    titles = {}
+    misses = []
+    for vid in vids:
+        cached = _cache_get(f'title:{vid}')
+        if cached is not None:
+            titles[vid] = cached
+        else:
+            misses.append(vid)
+
+    for i in range(0, len(misses), 50):
+        ids_str = ','.join(misses[i:i + 50])
+        resp = api_call(km, lambda yt: yt.videos().list(
+            part="snippet", id=ids_str,
+            fields="items(id,snippet/title)"))
+        if not resp:
+            continue
+        for it in resp.get('items', []):
+            titles[it['id']] = it['snippet']['title']
+            _cache_set(f"title:{it['id']}", it['snippet']['title'],
+                       expire=_TITLE_TTL)
+    return titles
+
+
+def thumb_many(km: KeyManager, urls: list):
+    """Download thumbnails for a batch of video URLs.
+
+    Titles come from _lookup_video_titles (disk-cached, batched), then the
+    downloads fan out through the shared thumbnail pool.
+    """
+    vids = []
+    for url in urls:
+        m = _VID_RE.search(url)
+        if m:
+            vids.append(m.group(1))
+        else:
+            print(f"  {C.Y}⚠  Cannot extract video ID from: {url}{C.E}")
+    if not vids:
+        print(f"  {C.R}✗  No video IDs found.{C.E}")
+        return
+
+    titles = _lookup_video_titles(km, vids)
+
+    os.makedirs(THUMBS_DIR, exist_ok=True)
+    count = 0
+    sess = _thumb_session()
+    with ThreadPoolExecutor(max_workers=16) as ex:
+        futs = {}
+        for vid in vids:
+            title = safe_filename(titles.get(vid, vid))
+            fname = os.path.join(THUMBS_DIR, f"{title} [{vid}].jpg")
+            futs[ex.submit(_fetch_thumbnail, sess, vid, fname)] = (vid, title)
+        for fut in as_completed(futs):
+            vid, title = futs[fut]
+            try:
+                fresh = fut.result()
+                count += 1
+                mark = '' if fresh else f"  {C.DM}↷ cached{C.E}"
+                print(f"  {C.G}✓{C.E}  {title}{mark}")
+            except Exception as e:
+                print(f"  {C.R}✗  {vid}: {e}{C.E}")
+    print(f"  {C.G}✦  Done {count}/{len(vids)} → {THUMBS_DIR}{C.E}")
+
+
 def thumb_single(km: KeyManager):
-    """Download thumbnail from a single video URL."""
-    url = input(f"\n  {C.BO}Paste video URL:{C.E} ").strip()
-    if not url:
+    """Download thumbnail(s) from one or more video URLs."""
+    raw = input(f"\n  {C.BO}Paste video URL(s), separated by spaces:{C.E} ").strip()
+    if not raw:
         return
 
+    urls = [u for u in re.split(r'[\s,]+', raw) if u]
+    if len(urls) > 1:
+        thumb_many(km, urls)
+        return
+    url = urls[0]
+
     # Extract video ID
-    m = re.search(r'(?:v=|youtu\.be/)([\w-]{11})', url)
+    m = _VID_RE.search(url)
     if not m:
         print(f"  {C.R}✗  Could not extract video ID from URL.{C.E}")
         return
     vid = m.group(1)
 
-    # Get title via API
-    resp = api_call(km, lambda yt: yt.videos().list(part="snippet", id=vid))
-    if resp and resp.get('items'):
-        title = resp['items'][0]['snippet']['title']
-    else:
-        title = vid
+    # Get title via API (disk-cached)
+    title = _lookup_video_titles(km, [vid]).get(vid, vid)
 
     print(f"  {C.CN}⟳  Downloading thumbnail for: {C.W}{title}{C.E}")
     _download_single_thumbnail(vid, title)
@@ -2232,32 +2854,39 @@ def thumb_channel(km: KeyManager):
     _ui_separator()
     print(f"  {C.DG}│{C.E} {C.G}{C.BO}Channel:{C.E}  {C.W}{ctitle}{C.E}")
     _ui_separator()
-    print(f"  {C.CN}⟳  Fetching videos...{C.E}")
+    print(f"  {C.CN}⟳  Fetching videos — downloads start as pages arrive...{C.E}")
 
-    all_vids = fetch_all_channel_videos(km, cid)
-    if not all_vids:
-        print(f"  {C.Y}⚠  No videos found.{C.E}")
-        return
-
-    print(f"  {C.G}✓  Found {len(all_vids)} video(s). Downloading thumbnails...{C.E}")
     os.makedirs(THUMBS_DIR, exist_ok=True)
 
     count = 0
-    total = len(all_vids)
-    for v in all_vids:
-        vid = v['videoId']
-        title = safe_filename(v['title'])
-        fname = os.path.join(THUMBS_DIR, f"{title} [{vid}].jpg")
-        url = f"https://img.youtube.com/vi/{vid}/maxresdefault.jpg"
-        try:
-            urllib.request.urlretrieve(url, fname)
-            if os.path.getsize(fname) < 5000:
-                url = f"https://img.youtube.com/vi/{vid}/hqdefault.jpg"
-                urllib.request.urlretrieve(url, fname)
-            count += 1
-            print(f"  {C.G}✓{C.E}  {C.DM}[{count}/{total}]{C.E}  {title}")
-        except Exception as e:
-            print(f"  {C.R}✗  {C.DM}[{count+1}/{total}]{C.E}  {vid}: {e}{C.E}")
+    sess = _thumb_session()
+    with ThreadPoolExecutor(max_workers=16) as ex:
+        # Submit each API page to the pool as soon as it lands, so the
+        # workers fetch thumbnails while later pages are still paginating
+        futs = {}
+        for page in _iter_channel_video_pages(km, cid):
+            for v in page:
+                title = safe_filename(v['title'])
+                fname = os.path.join(THUMBS_DIR, f"{title} [{v['videoId']}].jpg")
+                futs[ex.submit(_fetch_thumbnail, sess, v['videoId'], fname)] = \
+                    (v['videoId'], title)
+            print(f"  {C.DM}⟳  Queued {len(futs)} so far...{C.E}")
+
+        total = len(futs)
+        if not total:
+            print(f"  {C.Y}⚠  No videos found.{C.E}")
+            return
+
+        print(f"  {C.G}✓  Found {total} video(s). Downloading thumbnails...{C.E}")
+        for fut in as_completed(futs):
+            vid, title = futs[fut]
+            try:
+                fresh = fut.result()
+                count += 1
+                mark = '' if fresh else f"  {C.DM}↷ cached{C.E}"
+                print(f"  {C.G}✓{C.E}  {C.DM}[{count}/{total}]{C.E}  {title}{mark}")
+            except Exception as e:
+                print(f"  {C.R}✗  {C.DM}[{count+1}/{total}]{C.E}  {vid}: {e}{C.E}")
 
     _ui_separator()
     print(f"  {C.G}{C.BO}✦{C.E}  {C.G}Downloaded {count}/{total} thumbnail(s) → {THUMBS_DIR}{C.E}")
@@ -2267,7 +2896,7 @@ def thumb_channel(km: KeyManager):
 def mode_thumbnails(km: KeyManager):
     """Thumbnail download menu."""
     _ui_header('Thumbnails', C.CN)
-    _ui_menu_item('1', 'Download from single video URL', C.CN)
+    _ui_menu_item('1', 'Download from video URL(s)', C.CN)
     _ui_menu_item('2', 'Download all from a channel', C.G)
     _ui_menu_back('0', 'Back')
     ch = _ui_prompt()
@@ -2329,7 +2958,10 @@ def fetch_playlist_videos(km, playlist_id: str) -> list:
         def req(yt, pt=page_token):
             params = dict(part='snippet,contentDetails',
                           playlistId=playlist_id,
-                          maxResults=50)
+                          maxResults=50,
+                          fields='nextPageToken,items(contentDetails/videoId,'
+                                 'snippet(title,publishedAt,position,'
+                                 'resourceId/videoId))')
             if pt:
                 params['pageToken'] = pt
             return yt.playlistItems().list(**params)
@@ -2455,7 +3087,8 @@ def mode_playlist(km):
 # ═══════════════════════════════════════════════════════════════════════
 
 def main():
-    os.system('')  # enable ANSI colours on Windows
+    if os.name == 'nt':
+        os.system('')  # enable ANSI colours on Windows (no-op shell call)
 
     # ── Gemini CLI-style ASCII banner ──
     _print_cfinder_banner()